@@ -1,43 +1,314 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from PIL import Image
+import numpy as np
+from io import BytesIO
 import os
 
 # Set page config
 st.set_page_config(page_title="Sedai Flex Dashboard", layout="wide")
 
+MONTH_NAMES = np.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+QUARTER_NAMES = np.array(['Q1', 'Q2', 'Q3', 'Q4'])
+
+NUMERIC_COLS = ['Current Monthly Cost ($)', 'Est. Monthly Cost ($)',
+                'Cost Savings in $', 'Cost Savings in %', 'Initiated',
+                'Achieved Savings', 'Unachieveable Savings', 'Delayed Savings']
+
+# Every column the README requires of an execution report
+REQUIRED_COLS = ['Sprint', 'Start Date', 'End Date', 'Inference Type',
+                 'Region', 'Cloud Provider'] + NUMERIC_COLS
+
+# st.cache_data hashes DataFrame/Series arguments with a pickle walk over
+# every cell; a vectorized row hash is much cheaper and just as good a key
+PANDAS_HASH_FUNCS = {
+    pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes(),
+    pd.Series: lambda s: pd.util.hash_pandas_object(s, index=True).values.tobytes(),
+}
+
+# McKinsey-style palette
+COLORS = ['#051C2C', '#2251FF', '#00A9F4', '#3C96B4', '#AFC3FF', '#8C5AC8']
+CATEGORY_COLORS = {
+    'Initiated': '#2251FF',
+    'Delayed Savings': '#00A9F4',
+    'Unachieveable Savings': '#8C5AC8',
+    'Achieved Savings': '#3C96B4',
+}
+
+
+def _read_workbook(path_or_buffer):
+    # calamine (Rust-based parser) reads xlsx ~2x faster than openpyxl;
+    # fall back to openpyxl when python-calamine is not installed
+    try:
+        return pd.read_excel(path_or_buffer, sheet_name=0, engine="calamine")
+    except ImportError:
+        return pd.read_excel(path_or_buffer, sheet_name=0, engine="openpyxl")
+
+
+@st.cache_data
+def _parse_bytes(raw: bytes) -> pd.DataFrame:
+    df = _read_workbook(BytesIO(raw))
+
+    # Backfill any missing report columns with one reindex rather than one
+    # fragmenting insert per column
+    missing = [c for c in REQUIRED_COLS if c not in df.columns]
+    if missing:
+        df = df.reindex(columns=[*df.columns, *missing])
+
+    # Coerce the aggregated columns to numeric. float32 is plenty for dollar
+    # amounts and halves the bytes every downstream sum/groupby streams through.
+    for c in NUMERIC_COLS:
+        df[c] = pd.to_numeric(df[c], errors="coerce").astype("float32")
+
+    # Derive filter fields from Start Date (fall back to today when missing,
+    # including when the report has no Start Date column at all)
+    when = (pd.to_datetime(df["Start Date"], errors="coerce")
+            if "Start Date" in df.columns else pd.Series(pd.NaT, index=df.index))
+    when = when.fillna(pd.Timestamp.today())
+    m = when.dt.month.to_numpy()
+    y = when.dt.year.to_numpy()
+
+    # Fiscal year runs Apr 1 -> Mar 31 and is labelled by its *end* year
+    # (Apr 2024 - Mar 2025 => FY2025). Q1=Apr-Jun ... Q4=Jan-Mar.
+    fy_year = y + (m >= 4).astype(np.int16)
+    fy = np.char.add("FY", fy_year.astype(str))
+    quarter = QUARTER_NAMES[(m - 4) % 12 // 3]
+
+    df["Month"] = MONTH_NAMES[m - 1]
+    df["Year"] = y
+    df["FY"] = fy
+    df["Quarter"] = quarter
+    df["FY_Quarter"] = np.char.add(np.char.add(fy, " "), quarter)
+
+    # Low-cardinality strings -> category: groupby/isin/unique then hash
+    # small integer codes instead of Python strings, and memory shrinks
+    for c in ['Sprint', 'Inference Type', 'Region', 'Cloud Provider',
+              'Month', 'FY', 'Quarter', 'FY_Quarter']:
+        if c in df.columns:
+            df[c] = df[c].astype('category')
+    return df
+
+
+def load_data(uploaded=None, default_path="sedai_execution_report_sample_v4.xlsx"):
+    # Key the parse cache on the file's raw bytes so reruns (filter/widget
+    # changes) and re-uploads of the same report skip the Excel parse entirely
+    if uploaded is not None:
+        raw = uploaded.getvalue()
+    elif os.path.exists(default_path):
+        with open(default_path, "rb") as f:
+            raw = f.read()
+    else:
+        return pd.DataFrame()
+    return _parse_bytes(raw)
+
+@st.cache_data
+def _logo_bytes(path, width=200):
+    # Decode + downscale the logo once; reruns just reuse the PNG bytes
+    # instead of re-decoding the full-resolution file every time
+    from PIL import Image  # only the decode path needs Pillow
+    im = Image.open(path)
+    im.thumbnail((width * 2, width * 2), Image.LANCZOS)
+    buf = BytesIO()
+    im.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+
 # Logo from repo root, resized and centered
 logo_path = "flex_logo.png"
 if os.path.exists(logo_path):
-    image = Image.open(logo_path)
-    st.image(image, width=200, caption="")
+    st.image(_logo_bytes(logo_path), width=200, caption="")
 else:
     st.warning("⚠️ Logo not found at 'flex_logo.png'. Please upload it to the repo root.")
 
 # Title
 st.markdown("<h1 style='text-align: center;'>📊 Sedai Flex Dashboard</h1>", unsafe_allow_html=True)
 
-# Load data from Excel
-excel_path = "sedai_execution_report_sample_v4.xlsx"
-df = pd.read_excel(excel_path, sheet_name=0, engine="openpyxl")
+# Load data from Excel (an uploaded report takes precedence over the bundled sample)
+uploaded = st.sidebar.file_uploader("Upload Execution Report (XLSX)", type=["xlsx"])
+df = load_data(uploaded)
+if df.empty:
+    st.warning("⚠️ No data found. Upload an execution report to get started.")
+    st.stop()
+
+# Deferred until after the no-data early exit: importing plotly costs a few
+# hundred ms and is pure waste on reruns that stop before any chart
+import plotly.graph_objects as go
+
+# Sidebar filters (Month, Year, FY, Sprint)
+def multi_filter(label, col, order=None):
+    s = df[col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        present = s.cat.categories.tolist()   # already unique and sorted
+    else:
+        present = s.dropna().unique().tolist()
+    options = [o for o in order if o in present] if order is not None else sorted(present)
+    sel = st.sidebar.multiselect(label, options, default=options)
+    # Everything selected (the default) filters nothing - skip the mask
+    if len(sel) == len(options):
+        return None
+    return np.isin(df[col].to_numpy(), np.asarray(sel))
+
+
+masks = [m for m in (multi_filter("Month", "Month", order=MONTH_NAMES.tolist()),
+                     multi_filter("Year", "Year"),
+                     multi_filter("FY", "FY"),
+                     multi_filter("Sprint", "Sprint")) if m is not None]
+flt = df if not masks else df[np.logical_and.reduce(masks)]
+if flt.empty:
+    st.info("No rows match the current filters.")
+    st.stop()
+
+# KPI row, recomputed only when the filter result actually changes. Only
+# the two columns the KPIs read are hashed for the cache key.
+@st.cache_data(hash_funcs=PANDAS_HASH_FUNCS)
+def compute_kpis(kpi_cols):
+    total_recs = len(kpi_cols)
+    savings = float(kpi_cols['Cost Savings in $'].sum())
+    current = float(kpi_cols['Current Monthly Cost ($)'].sum())
+    # Weighted definition: sum(savings $) / sum(current $), divided in float64
+    pct = savings / current * 100.0 if current else 0.0
+    avg = savings / total_recs if total_recs else 0.0
+    return total_recs, savings, pct, avg
+
+
+total_recs, total_savings, savings_pct, avg_savings = compute_kpis(
+    flt[['Cost Savings in $', 'Current Monthly Cost ($)']])
+k1, k2, k3, k4 = st.columns(4)
+k1.metric("Total Recommendations", f"{total_recs:,}")
+k2.metric("Total Savings ($)", f"${total_savings:,.0f}")
+k3.metric("Total Savings (%)", f"{savings_pct:.1f}%")
+k4.metric("Avg Savings / Recommendation ($)", f"${avg_savings:,.0f}")
 
 # Filter for latest Sprint
-latest_sprint = df['Sprint'].dropna().sort_values().iloc[-1]
-df_latest = df[df['Sprint'] == latest_sprint]
+latest_sprint = flt['Sprint'].dropna().sort_values().iloc[-1]
+df_latest = flt[flt['Sprint'] == latest_sprint]
 
 # Aggregate cost and savings
 summary = df_latest[['Current Monthly Cost ($)', 'Est. Monthly Cost ($)', 'Cost Savings in $']].sum().reset_index()
 summary.columns = ['Metric', 'Amount']
 
 # Bar chart for cost and savings
-fig = px.bar(summary, x='Metric', y='Amount', title=f"Cost Summary for {latest_sprint}", text_auto=True)
-st.plotly_chart(fig, use_container_width=True)
+@st.cache_data(hash_funcs=PANDAS_HASH_FUNCS)
+def build_cost_summary_fig(summary, sprint_label):
+    fig = go.Figure(go.Bar(x=summary['Metric'].to_numpy(), y=summary['Amount'].to_numpy(),
+                           marker_color=COLORS[1], texttemplate='$%{y:,.0f}'))
+    fig.update_layout(title=f"Cost Summary for {sprint_label}")
+    return fig
+
+
+st.plotly_chart(build_cost_summary_fig(summary, latest_sprint), use_container_width=True)
 
 # Data table
 st.subheader("📋 Raw Data for Latest Sprint")
 st.dataframe(df_latest, use_container_width=True)
 
+# One per-Sprint aggregation feeds both the Sprint chart and the summary
+# table, so the group indexer is built (and the data scanned) only once.
+# Precompute the >0 flags so the counts use the fast C 'sum' path
+# instead of a Python lambda evaluated per group.
+flt_tmp = flt.assign(_ach_c=flt['Achieved Savings'] > 0,
+                     _un_c=flt['Unachieveable Savings'] > 0,
+                     _del_c=flt['Delayed Savings'] > 0,
+                     _init_c=flt['Initiated'] > 0)
+# observed=True skips materializing filtered-out Sprint categories and
+# sort=False skips a group sort that both consumers reorder anyway
+sprint_agg = flt_tmp.groupby('Sprint', dropna=False, observed=True, sort=False).agg(
+    Recommendations=('Sprint', 'size'),
+    Current_USD=('Current Monthly Cost ($)', 'sum'),
+    Estimated_USD=('Est. Monthly Cost ($)', 'sum'),
+    Savings_USD=('Cost Savings in $', 'sum'),
+    Achieved_USD=('Achieved Savings', 'sum'),
+    Unachievable_USD=('Unachieveable Savings', 'sum'),
+    Delayed_USD=('Delayed Savings', 'sum'),
+    Initiated_USD=('Initiated', 'sum'),
+    Achieved_Count=('_ach_c', 'sum'),
+    Unachievable_Count=('_un_c', 'sum'),
+    Delayed_Count=('_del_c', 'sum'),
+    Initiated_Count=('_init_c', 'sum'),
+)
+
+# Charts: savings pipeline and savings by inference type, side by side.
+# Traces are built with graph_objects directly - px would wrap these tiny
+# inputs in intermediate DataFrames and re-infer every column.
+# One multi-column sum serves both the funnel and the mix pie instead of
+# a separate full-column scan per category per chart; the resulting numpy
+# array and the column-name tuple feed the traces directly, with no
+# intermediate DataFrame to build and re-infer
+CATEGORY_COLS = ('Initiated', 'Delayed Savings', 'Unachieveable Savings',
+                 'Achieved Savings')
+stage_vals = flt[list(CATEGORY_COLS)].sum().to_numpy()
+stage_colors = [CATEGORY_COLORS[c] for c in CATEGORY_COLS]
+
+c1, c2 = st.columns(2)
+with c1:
+    st.subheader("🔻 Savings Pipeline")
+    fig_funnel = go.Figure(go.Funnel(
+        y=CATEGORY_COLS, x=stage_vals,
+        marker_color=stage_colors,
+        texttemplate='$%{x:,.0f}'))
+    st.plotly_chart(fig_funnel, use_container_width=True)
+with c2:
+    st.subheader("📊 Savings by Inference Type")
+
+    @st.cache_data(hash_funcs=PANDAS_HASH_FUNCS)
+    def build_inference_fig(inf_grp):
+        fig = go.Figure(go.Bar(x=inf_grp.index, y=inf_grp.to_numpy(),
+                               marker_color=COLORS[2], texttemplate='$%{y:,.0f}'))
+        fig.update_layout(yaxis=dict(tickprefix='$', separatethousands=True))
+        return fig
+
+    inf_grp = flt.groupby('Inference Type', dropna=False, observed=True,
+                          sort=False)['Cost Savings in $'] \
+                 .sum().sort_values(ascending=False)
+    st.plotly_chart(build_inference_fig(inf_grp), use_container_width=True)
+
+# Recommendations by Sprint & Savings ($): dual-axis bar + line
+st.subheader("📈 Recommendations by Sprint & Savings ($)")
+
+
+@st.cache_data(hash_funcs=PANDAS_HASH_FUNCS)
+def build_sprint_fig(s_grp):
+    # Scattergl renders via WebGL rather than one SVG node per point, and
+    # zero-width bar strokes skip a per-bar outline path
+    x = s_grp.index.to_numpy()
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=x, y=s_grp['Recommendations'].to_numpy(), name='Recommendations',
+        marker=dict(line=dict(width=0))))
+    fig.add_trace(go.Scattergl(
+        x=x, y=s_grp['Savings_USD'].to_numpy(), name='Savings ($)',
+        mode='lines+markers', yaxis='y2'))
+    fig.update_layout(
+        yaxis=dict(title='Recommendations'),
+        yaxis2=dict(title='Savings ($)', overlaying='y', side='right',
+                    tickprefix='$', separatethousands=True),
+        legend=dict(orientation='h', y=1.1))
+    return fig
+
+
+s_grp = sprint_agg.sort_values('Savings_USD', ascending=False)
+st.plotly_chart(build_sprint_fig(s_grp), use_container_width=True)
+
+# Savings mix pie across the four categories
+st.subheader("🥧 Savings Mix")
+fig_mix = go.Figure(go.Pie(
+    labels=CATEGORY_COLS, values=stage_vals,
+    marker=dict(colors=stage_colors),
+    texttemplate='%{label}<br>$%{value:,.0f}'))
+st.plotly_chart(fig_mix, use_container_width=True)
+
+# Sprint summary table: savings $ and recommendation counts per category
+st.subheader("🏁 Sprint Summary")
+# reset_index() already returns a fresh frame, so the $ formatting below
+# can assign columns without a defensive copy
+disp = sprint_agg.sort_index().reset_index()
+MONEY_COLS = ['Current_USD', 'Estimated_USD', 'Savings_USD', 'Achieved_USD',
+              'Unachievable_USD', 'Delayed_USD', 'Initiated_USD']
+# Format $ columns in one pass per column instead of a Python .map per cell
+for c in MONEY_COLS:
+    disp[c] = [f"${v:,.0f}" for v in disp[c].tolist()]
+st.dataframe(disp, use_container_width=True)
+
 # Footer
 st.markdown("---")
 st.caption("© 2025 Sedai Flex Dashboard | FinOps")